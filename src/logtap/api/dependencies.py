@@ -4,7 +4,7 @@ import secrets
 from functools import lru_cache
 from typing import Optional
 
-from fastapi import Header, HTTPException, status
+from fastapi import Header, HTTPException, WebSocket, status
 
 from logtap.models.config import Settings
 
@@ -59,3 +59,23 @@ async def verify_api_key(
         )
 
     return x_api_key
+
+
+def is_websocket_authorized(websocket: WebSocket) -> bool:
+    """
+    Check the API key sent with a WebSocket handshake.
+
+    WebSocket routes cannot raise HTTPException after accepting, so this returns
+    a bool and leaves closing the connection to the caller.
+
+    Args:
+        websocket: The WebSocket connection.
+
+    Returns:
+        True if authentication is disabled or the X-API-Key header matches.
+    """
+    settings = get_settings()
+    if not settings.api_key:
+        return True
+    x_api_key = websocket.headers.get("x-api-key")
+    return bool(x_api_key) and secrets.compare_digest(x_api_key, settings.api_key)
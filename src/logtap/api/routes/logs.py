@@ -1,19 +1,23 @@
 """Log query endpoints for logtap."""
 
 import asyncio
+import json
 import os
-from typing import Optional
+from typing import List, Optional, Tuple
 
-import aiofiles
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
 from starlette.responses import StreamingResponse
 
-from logtap.api.dependencies import get_settings, verify_api_key
-from logtap.core.reader import tail_async
+from logtap.api.dependencies import get_settings, is_websocket_authorized, verify_api_key
+from logtap.core.follow import FileFollower, get_tail_window
+from logtap.core.reader import read_from_offset_async, tail_async
+from logtap.core.sampling import StreamSampler, build_sampler
 from logtap.core.search import filter_lines
+from logtap.core.subscriptions import Subscription
 from logtap.core.validation import is_filename_valid, is_limit_valid, is_search_term_valid
+from logtap.core.watcher import get_file_state, get_watcher
 from logtap.models.config import Settings
-from logtap.models.responses import LogResponse
+from logtap.models.responses import LogResponse, PollResponse
 
 router = APIRouter()
 
@@ -39,6 +43,16 @@ def validate_filename(filename: str) -> None:
         )
 
 
+def get_sampler(
+    sample: Optional[str], max_lines_per_sec: Optional[float], reservoir: Optional[int]
+) -> Optional[StreamSampler]:
+    """Build a stream sampler from query parameters, raising HTTPException if invalid."""
+    try:
+        return build_sampler(sample, max_lines_per_sec, reservoir)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 def get_filepath(filename: str, settings: Settings) -> str:
     """Get full filepath and validate it exists."""
     log_dir = settings.get_log_directory()
@@ -148,16 +162,94 @@ async def get_logs_multi(
     return {"results": results, "files_queried": len(file_list)}
 
 
+@router.get("/poll", response_model=PollResponse)
+async def poll_logs(
+    filename: str = Query(default="syslog", description="Name of the log file to read"),
+    after: Optional[int] = Query(
+        default=None,
+        ge=0,
+        description="Byte offset to read from (next_offset of the previous poll). "
+        "Omit to start at the current end of the file.",
+    ),
+    wait: float = Query(
+        default=30.0, ge=0, description="Seconds to wait for new lines before returning"
+    ),
+    limit: int = Query(default=1000, ge=1, le=1000, description="Maximum lines to return"),
+    settings: Settings = Depends(get_settings),
+    _api_key: Optional[str] = Depends(verify_api_key),
+) -> PollResponse:
+    """
+    Long-poll for lines appended to a log file.
+
+    Returns complete lines written after the given byte offset as soon as any
+    exist, or an empty list once the wait expires. Pass next_offset back as
+    'after' to continue. Waiting parks on a shared file-change notification,
+    so idle pollers do not spin.
+    """
+    validate_filename(filename)
+    filepath = get_filepath(filename, settings)
+
+    size = os.path.getsize(filepath)
+    offset = size if after is None else after
+    truncated = False
+    if offset > size:
+        # File was truncated or rotated underneath the client; start over
+        offset = 0
+        truncated = True
+
+    lines, next_offset = await read_from_offset_async(filepath, offset, max_lines=limit)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(wait, settings.poll_max_wait)
+    watcher = get_watcher(filepath, interval=settings.watch_interval)
+    seen_size = size
+
+    # A change may only add a partial line, so keep waiting until the deadline
+    while not lines:
+        remaining = deadline - loop.time()
+        if remaining <= 0 or not await watcher.wait_for_change(seen_size, timeout=remaining):
+            break
+        state = get_file_state(filepath)
+        if state is None:
+            break
+        seen_size = state[2]
+        if seen_size < offset:
+            offset = 0
+            truncated = True
+        lines, next_offset = await read_from_offset_async(filepath, offset, max_lines=limit)
+
+    return PollResponse(
+        lines=lines,
+        count=len(lines),
+        filename=filename,
+        offset=offset,
+        next_offset=next_offset,
+        truncated=truncated,
+    )
+
+
 @router.websocket("/stream")
 async def stream_logs(
     websocket: WebSocket,
     filename: str = Query(default="syslog"),
+    backlog: int = Query(default=0, ge=0, le=1000),
+    sample: Optional[str] = Query(default=None),
+    max_lines_per_sec: Optional[float] = Query(default=None),
+    reservoir: Optional[int] = Query(default=None),
 ):
     """
     Stream log file changes in real-time via WebSocket.
 
     Connect to this endpoint to receive new log lines as they are written.
-    Similar to `tail -f`.
+    Similar to `tail -f`. With backlog=N, the last N lines are sent first and
+    streaming continues from exactly where they end, so no line is lost or
+    repeated between the two.
+
+    For very hot files, sample=1/N, max_lines_per_sec and reservoir (lines
+    per frame) thin the stream. With any of them set, frames are JSON objects
+    that also count the lines skipped since the previous frame:
+
+        {"lines": ["..."], "suppressed": 1234}
     """
     await websocket.accept()
 
@@ -166,6 +258,7 @@ async def stream_logs(
 
     try:
         validate_filename(filename)
+        sampler = get_sampler(sample, max_lines_per_sec, reservoir)
     except HTTPException as e:
         await websocket.send_json({"error": e.detail})
         await websocket.close()
@@ -179,26 +272,42 @@ async def stream_logs(
         await websocket.close()
         return
 
+    async def send_lines(lines: List[str]) -> None:
+        if sampler is None:
+            for line in lines:
+                await websocket.send_text(line)
+            return
+        kept = sampler.apply(lines)
+        if sampler.should_send(kept):
+            await websocket.send_json({"lines": kept, "suppressed": sampler.take_suppressed()})
+
+    receive_task = asyncio.ensure_future(websocket.receive_text())
     try:
-        async with aiofiles.open(filepath, mode="r", encoding="utf-8") as f:
-            # Seek to end of file
-            await f.seek(0, 2)
-
-            while True:
-                line = await f.readline()
-                if line:
-                    await websocket.send_text(line.rstrip("\n"))
-                else:
-                    # No new content, wait a bit
-                    await asyncio.sleep(0.1)
-
-                # Check if client is still connected
-                try:
-                    # Non-blocking receive to check connection
-                    await asyncio.wait_for(websocket.receive_text(), timeout=0.01)
-                except asyncio.TimeoutError:
-                    # No message, continue streaming
-                    pass
+        lines, offset = await open_stream(filepath, backlog, settings)
+        if lines:
+            await send_lines(lines)
+
+        follower = FileFollower(
+            filepath,
+            offset,
+            max_lines=settings.stream_batch_lines,
+            interval=settings.watch_interval,
+        )
+        # With a sampler, wake up regularly to report lines suppressed so far
+        timeout = sampler.flush_interval if sampler else None
+        while True:
+            batch_task = asyncio.ensure_future(follower.next_batch(timeout))
+            await asyncio.wait([receive_task, batch_task], return_when=asyncio.FIRST_COMPLETED)
+
+            if receive_task.done():
+                batch_task.cancel()
+                # Raises WebSocketDisconnect if the client went away; other
+                # client messages are ignored
+                receive_task.result()
+                receive_task = asyncio.ensure_future(websocket.receive_text())
+                continue
+
+            await send_lines(batch_task.result())
 
     except WebSocketDisconnect:
         pass
@@ -208,36 +317,226 @@ async def stream_logs(
         except Exception:
             # Connection already closed, ignore
             pass
+    finally:
+        receive_task.cancel()
+
+
+async def open_stream(filepath: str, backlog: int, settings: Settings) -> Tuple[List[str], int]:
+    """
+    Get the backlog lines for a new stream and the offset to follow from.
+
+    The backlog comes from a shared in-memory tail window, so many clients
+    (re)connecting at once do not each re-read the end of the file.
+    """
+    window = get_tail_window(
+        filepath,
+        max_lines=settings.tail_window_lines,
+        cache_size=settings.tail_window_cache_size,
+    )
+    return await window.snapshot(backlog)
+
+
+@router.websocket("/subscribe")
+async def subscribe_logs(
+    websocket: WebSocket,
+    sample: Optional[str] = Query(default=None),
+    max_lines_per_sec: Optional[float] = Query(default=None),
+    reservoir: Optional[int] = Query(default=None),
+):
+    """
+    Follow many log files over a single WebSocket.
+
+    Send JSON messages to manage the subscription:
+
+        {"action": "subscribe", "files": ["syslog", "nginx/*.log"]}
+        {"action": "unsubscribe", "files": ["nginx/*.log"]}
+
+    Glob patterns are re-resolved periodically, so files that appear later
+    are picked up automatically. New lines from all files are sent in
+    batches, each tagged with its source file:
+
+        {"type": "lines", "lines": [{"file": "syslog", "line": "..."}]}
+
+    The sample, max_lines_per_sec and reservoir query parameters thin the
+    combined stream, in which case each lines frame also carries a
+    "suppressed" count.
+    """
+    await websocket.accept()
+    settings = get_settings()
+
+    if not is_websocket_authorized(websocket):
+        await websocket.send_json({"type": "error", "error": "Invalid or missing API key."})
+        await websocket.close(code=1008)
+        return
+
+    try:
+        sampler = get_sampler(sample, max_lines_per_sec, reservoir)
+    except HTTPException as e:
+        await websocket.send_json({"type": "error", "error": e.detail})
+        await websocket.close()
+        return
+
+    subscription = Subscription(
+        settings.get_log_directory(), max_files=settings.subscribe_max_files
+    )
+    loop = asyncio.get_running_loop()
+    next_rescan = loop.time() + settings.subscribe_rescan_interval
+    receive_task = asyncio.ensure_future(websocket.receive_text())
+
+    async def handle_message(text: str) -> None:
+        try:
+            message = json.loads(text)
+            action = message["action"]
+            patterns = message["files"]
+            if isinstance(patterns, str):
+                patterns = [patterns]
+        except (ValueError, KeyError, TypeError):
+            await websocket.send_json(
+                {"type": "error", "error": 'Expected {"action": ..., "files": [...]}'}
+            )
+            return
+
+        try:
+            if action == "subscribe":
+                changed = subscription.subscribe(patterns)
+            elif action == "unsubscribe":
+                changed = subscription.unsubscribe(patterns)
+            else:
+                raise ValueError(f"Unknown action: {action}")
+        except ValueError as e:
+            await websocket.send_json({"type": "error", "error": str(e)})
+            return
+
+        await websocket.send_json(
+            {
+                "type": f"{action}d",
+                "patterns": sorted(subscription.patterns),
+                "files": changed,
+            }
+        )
+
+    try:
+        while True:
+            batch = await subscription.read_batch(settings.stream_batch_lines)
+            kept = sampler.apply(batch) if sampler else batch
+            if sampler and sampler.should_send(kept):
+                await websocket.send_json(
+                    {
+                        "type": "lines",
+                        "lines": [{"file": name, "line": line} for name, line in kept],
+                        "suppressed": sampler.take_suppressed(),
+                    }
+                )
+            elif kept:
+                await websocket.send_json(
+                    {
+                        "type": "lines",
+                        "lines": [{"file": name, "line": line} for name, line in kept],
+                    }
+                )
+
+            if loop.time() >= next_rescan:
+                next_rescan = loop.time() + settings.subscribe_rescan_interval
+                try:
+                    added = subscription.rescan()
+                except ValueError as e:
+                    added = []
+                    await websocket.send_json({"type": "error", "error": str(e)})
+                if added:
+                    await websocket.send_json({"type": "added", "files": added})
+
+            if len(batch) >= settings.stream_batch_lines:
+                # More lines are already waiting; don't park
+                continue
+
+            timeout = max(next_rescan - loop.time(), 0)
+            waiters = [
+                asyncio.ensure_future(
+                    get_watcher(path, settings.watch_interval).wait_for_change(size, timeout)
+                )
+                for path, size in subscription.pending()
+            ]
+            try:
+                await asyncio.wait(
+                    [receive_task, *waiters],
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+            if receive_task.done():
+                text = receive_task.result()
+                receive_task = asyncio.ensure_future(websocket.receive_text())
+                await handle_message(text)
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receive_task.cancel()
 
 
 @router.get("/sse")
 async def stream_logs_sse(
     filename: str = Query(default="syslog", description="Log file to stream"),
+    backlog: int = Query(
+        default=0, ge=0, le=1000, description="Number of existing lines to send first"
+    ),
+    sample: Optional[str] = Query(default=None, description="Keep 1 line in N, e.g. 1/10"),
+    max_lines_per_sec: Optional[float] = Query(
+        default=None, description="Maximum lines delivered per second"
+    ),
+    reservoir: Optional[int] = Query(
+        default=None, description="Maximum lines per event, sampled uniformly"
+    ),
     settings: Settings = Depends(get_settings),
     _api_key: Optional[str] = Depends(verify_api_key),
 ):
     """
     Stream log file changes via Server-Sent Events (SSE).
 
-    Alternative to WebSocket for simpler clients.
+    Alternative to WebSocket for simpler clients. Supports the same gapless
+    backlog=N handoff and sampling options as the WebSocket stream; with
+    sampling enabled each event is a JSON object with lines and a suppressed
+    count.
     """
     validate_filename(filename)
+    sampler = get_sampler(sample, max_lines_per_sec, reservoir)
     filepath = get_filepath(filename, settings)
+    lines, offset = await open_stream(filepath, backlog, settings)
+
+    def events(batch: List[str]) -> Optional[str]:
+        if sampler is None:
+            # SSE format: data: <content>\n\n
+            return "".join(f"data: {line}\n\n" for line in batch)
+        kept = sampler.apply(batch)
+        if not sampler.should_send(kept):
+            return None
+        frame = {"lines": kept, "suppressed": sampler.take_suppressed()}
+        return f"data: {json.dumps(frame)}\n\n"
 
     async def event_generator():
-        async with aiofiles.open(filepath, mode="r", encoding="utf-8") as f:
-            # Seek to end
-            await f.seek(0, 2)
-
-            while True:
-                line = await f.readline()
-                if line:
-                    # SSE format: data: <content>\n\n
-                    yield f"data: {line.rstrip()}\n\n"
-                else:
-                    # Send heartbeat to keep connection alive
-                    yield ": heartbeat\n\n"
-                    await asyncio.sleep(1)
+        if lines:
+            backlog_events = events(lines)
+            if backlog_events:
+                yield backlog_events
+
+        follower = FileFollower(
+            filepath,
+            offset,
+            max_lines=settings.stream_batch_lines,
+            interval=settings.watch_interval,
+        )
+        timeout = sampler.flush_interval if sampler else settings.sse_heartbeat_interval
+        while True:
+            batch = await follower.next_batch(timeout=timeout)
+            batch_events = events(batch)
+            if batch_events:
+                yield batch_events
+            elif not batch:
+                # Send heartbeat to keep connection alive
+                yield ": heartbeat\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -1,19 +1,50 @@
 """Parsed log endpoints for logtap - with format detection and severity filtering."""
 
+import asyncio
+import json
 import os
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from starlette.responses import StreamingResponse
 
-from logtap.api.dependencies import get_settings, verify_api_key
-from logtap.core.parsers import AutoParser, LogLevel
+from logtap.api.dependencies import get_settings, is_websocket_authorized, verify_api_key
+from logtap.api.routes.logs import get_filepath, get_sampler, open_stream, validate_filename
+from logtap.core.follow import FileFollower
+from logtap.core.parsers import AutoParser, LogLevel, ParsedLogEntry, detect_file_format
 from logtap.core.reader import tail_async
+from logtap.core.sampling import StreamSampler
 from logtap.core.search import filter_entries
 from logtap.models.config import Settings
 
 router = APIRouter()
 
 
+def parse_level_filters(
+    level: Optional[str], levels: Optional[str]
+) -> Tuple[Optional[LogLevel], Optional[List[LogLevel]]]:
+    """Parse the level and levels query parameters, raising HTTPException if invalid."""
+    min_level = None
+    if level:
+        min_level = LogLevel.from_string(level)
+        if not min_level:
+            valid = "DEBUG, INFO, NOTICE, WARNING, ERROR, CRITICAL, ALERT, EMERGENCY"
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid level: {level}. Valid levels: {valid}",
+            )
+
+    level_list = None
+    if levels:
+        level_list = []
+        for lvl in levels.split(","):
+            parsed = LogLevel.from_string(lvl.strip())
+            if parsed:
+                level_list.append(parsed)
+
+    return min_level, level_list
+
+
 @router.get("")
 async def get_parsed_logs(
     filename: str = Query(default="syslog", description="Name of the log file to read"),
@@ -64,25 +95,7 @@ async def get_parsed_logs(
     parser = AutoParser()
     entries = parser.parse_many(lines)
 
-    # Parse level filter
-    min_level = None
-    if level:
-        min_level = LogLevel.from_string(level)
-        if not min_level:
-            valid = "DEBUG, INFO, NOTICE, WARNING, ERROR, CRITICAL, ALERT, EMERGENCY"
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid level: {level}. Valid levels: {valid}",
-            )
-
-    # Parse levels filter
-    level_list = None
-    if levels:
-        level_list = []
-        for lvl in levels.split(","):
-            parsed = LogLevel.from_string(lvl.strip())
-            if parsed:
-                level_list.append(parsed)
+    min_level, level_list = parse_level_filters(level, levels)
 
     # Apply filters
     filtered = filter_entries(
@@ -100,3 +113,208 @@ async def get_parsed_logs(
         "filename": filename,
         "format": parser.name,
     }
+
+
+class EntryStream:
+    """
+    Parses and filters lines from a followed file in batches.
+
+    The format is detected once per file and shared by every stream on it.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        term: Optional[str],
+        regex: Optional[str],
+        min_level: Optional[LogLevel],
+        levels: Optional[List[LogLevel]],
+        case_sensitive: bool,
+    ):
+        self.parser = AutoParser(detect_file_format(filepath))
+        self.term = term
+        self.regex = regex
+        self.min_level = min_level
+        self.levels = levels
+        self.case_sensitive = case_sensitive
+
+    def process(self, lines: List[str]) -> List[ParsedLogEntry]:
+        """Parse a batch of lines and apply the stream's filters."""
+        if not lines:
+            return []
+        return filter_entries(
+            self.parser.parse_many(lines),
+            term=self.term,
+            regex=self.regex,
+            min_level=self.min_level,
+            levels=self.levels,
+            case_sensitive=self.case_sensitive,
+        )
+
+
+def sampled_frame(
+    batch: List[ParsedLogEntry], sampler: Optional[StreamSampler]
+) -> Optional[dict]:
+    """Build a stream frame for a batch of entries, or None if nothing should be sent."""
+    if sampler is None:
+        return {"entries": [e.to_compact_dict() for e in batch]} if batch else None
+    kept = sampler.apply(batch)
+    if not sampler.should_send(kept):
+        return None
+    return {
+        "entries": [e.to_compact_dict() for e in kept],
+        "suppressed": sampler.take_suppressed(),
+    }
+
+
+@router.websocket("/stream")
+async def stream_parsed_logs(
+    websocket: WebSocket,
+    filename: str = Query(default="syslog"),
+    term: str = Query(default=""),
+    regex: Optional[str] = Query(default=None),
+    level: Optional[str] = Query(default=None),
+    levels: Optional[str] = Query(default=None),
+    case_sensitive: bool = Query(default=True),
+    backlog: int = Query(default=0, ge=0, le=1000),
+    sample: Optional[str] = Query(default=None),
+    max_lines_per_sec: Optional[float] = Query(default=None),
+    reservoir: Optional[int] = Query(default=None),
+):
+    """
+    Stream parsed, filtered log entries in real-time via WebSocket.
+
+    New lines are parsed in batches and filtered on the server by level,
+    levels and term, and each batch is sent as one compact frame:
+
+        {"entries": [{"ts": "...", "level": "ERROR", "source": "...", "message": "..."}]}
+
+    Matching entries can be thinned with sample, max_lines_per_sec and
+    reservoir, in which case frames also carry a "suppressed" count.
+    """
+    await websocket.accept()
+    settings = get_settings()
+
+    if not is_websocket_authorized(websocket):
+        await websocket.send_json({"error": "Invalid or missing API key."})
+        await websocket.close(code=1008)
+        return
+
+    try:
+        validate_filename(filename)
+        filepath = get_filepath(filename, settings)
+        min_level, level_list = parse_level_filters(level, levels)
+        sampler = get_sampler(sample, max_lines_per_sec, reservoir)
+    except HTTPException as e:
+        await websocket.send_json({"error": e.detail})
+        await websocket.close()
+        return
+
+    entries = EntryStream(filepath, term or None, regex, min_level, level_list, case_sensitive)
+
+    async def send_entries(batch: List[ParsedLogEntry]) -> None:
+        frame = sampled_frame(batch, sampler)
+        if frame is not None:
+            await websocket.send_json(frame)
+
+    receive_task = asyncio.ensure_future(websocket.receive_text())
+    try:
+        lines, offset = await open_stream(filepath, backlog, settings)
+        await send_entries(entries.process(lines))
+
+        follower = FileFollower(
+            filepath,
+            offset,
+            max_lines=settings.stream_batch_lines,
+            interval=settings.watch_interval,
+        )
+        timeout = sampler.flush_interval if sampler else None
+        while True:
+            batch_task = asyncio.ensure_future(follower.next_batch(timeout))
+            await asyncio.wait([receive_task, batch_task], return_when=asyncio.FIRST_COMPLETED)
+
+            if receive_task.done():
+                batch_task.cancel()
+                receive_task.result()
+                receive_task = asyncio.ensure_future(websocket.receive_text())
+                continue
+
+            await send_entries(entries.process(batch_task.result()))
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        try:
+            await websocket.send_json({"error": str(e)})
+        except Exception:
+            pass
+    finally:
+        receive_task.cancel()
+
+
+@router.get("/sse")
+async def stream_parsed_logs_sse(
+    filename: str = Query(default="syslog", description="Log file to stream"),
+    term: str = Query(default="", description="Substring to search for"),
+    regex: Optional[str] = Query(default=None, description="Regex pattern to match"),
+    level: Optional[str] = Query(default=None, description="Minimum severity level"),
+    levels: Optional[str] = Query(default=None, description="Comma-separated levels"),
+    case_sensitive: bool = Query(default=True),
+    backlog: int = Query(
+        default=0, ge=0, le=1000, description="Number of existing lines to send first"
+    ),
+    sample: Optional[str] = Query(default=None, description="Keep 1 entry in N, e.g. 1/10"),
+    max_lines_per_sec: Optional[float] = Query(
+        default=None, description="Maximum entries delivered per second"
+    ),
+    reservoir: Optional[int] = Query(
+        default=None, description="Maximum entries per event, sampled uniformly"
+    ),
+    settings: Settings = Depends(get_settings),
+    _api_key: Optional[str] = Depends(verify_api_key),
+):
+    """
+    Stream parsed, filtered log entries via Server-Sent Events (SSE).
+
+    Each event carries one frame in the same shape as the WebSocket stream.
+    """
+    validate_filename(filename)
+    filepath = get_filepath(filename, settings)
+    min_level, level_list = parse_level_filters(level, levels)
+    sampler = get_sampler(sample, max_lines_per_sec, reservoir)
+
+    entries = EntryStream(filepath, term or None, regex, min_level, level_list, case_sensitive)
+    lines, offset = await open_stream(filepath, backlog, settings)
+
+    def events(batch: List[ParsedLogEntry]) -> Optional[str]:
+        frame = sampled_frame(batch, sampler)
+        return None if frame is None else f"data: {json.dumps(frame)}\n\n"
+
+    async def event_generator():
+        backlog_events = events(entries.process(lines))
+        if backlog_events:
+            yield backlog_events
+
+        follower = FileFollower(
+            filepath,
+            offset,
+            max_lines=settings.stream_batch_lines,
+            interval=settings.watch_interval,
+        )
+        timeout = sampler.flush_interval if sampler else settings.sse_heartbeat_interval
+        while True:
+            batch = await follower.next_batch(timeout=timeout)
+            batch_events = events(entries.process(batch))
+            if batch_events:
+                yield batch_events
+            elif not batch:
+                yield ": heartbeat\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
@@ -1,5 +1,6 @@
 """Tail command for logtap CLI - real-time log streaming."""
 
+import json
 from typing import Optional
 
 import typer
@@ -39,6 +40,16 @@ def tail(
         help="API key for authentication.",
         envvar="LOGTAP_API_KEY",
     ),
+    sample: Optional[str] = typer.Option(
+        None,
+        "--sample",
+        help="When following, show 1 line in N (e.g. 1/100) of a very busy file.",
+    ),
+    max_rate: Optional[float] = typer.Option(
+        None,
+        "--max-rate",
+        help="When following, show at most this many lines per second.",
+    ),
 ) -> None:
     """
     Tail a log file, optionally following new entries.
@@ -47,14 +58,22 @@ def tail(
         logtap tail syslog
         logtap tail auth.log -f
         logtap tail syslog --lines 100
+        logtap tail access.log -f --max-rate 50
     """
     import httpx
 
-    # First, get initial lines
     headers = {}
     if api_key:
         headers["X-API-Key"] = api_key
 
+    if follow:
+        # The stream sends the backlog itself and continues from exactly where
+        # it ends, so no lines are lost between an initial query and following.
+        console.print("[dim]Streaming new entries... (Ctrl+C to stop)[/dim]")
+        console.print()
+        _follow(server, filename, lines, api_key, sample, max_rate)
+        return
+
     params = {
         "filename": filename,
         "limit": lines,
@@ -76,42 +95,6 @@ def tail(
         for line in log_lines:
             console.print(line)
 
-        if follow:
-            console.print()
-            console.print("[dim]Streaming new entries... (Ctrl+C to stop)[/dim]")
-            console.print()
-
-            # Stream new entries via WebSocket
-            import asyncio
-
-            async def stream_logs():
-                import websockets
-
-                ws_url = server.replace("http://", "ws://").replace("https://", "wss://")
-                ws_url = f"{ws_url}/logs/stream?filename={filename}"
-
-                extra_headers = {}
-                if api_key:
-                    extra_headers["X-API-Key"] = api_key
-
-                try:
-                    async with websockets.connect(ws_url, extra_headers=extra_headers) as ws:
-                        async for message in ws:
-                            console.print(message)
-                except websockets.exceptions.InvalidStatusCode as e:
-                    if e.status_code == 404:
-                        console.print("[yellow]Streaming not available.[/yellow]")
-                        console.print("[dim]Server may need updating.[/dim]")
-                    else:
-                        console.print(f"[red]WebSocket error: {e}[/red]")
-                except Exception as e:
-                    console.print(f"[red]Streaming error: {e}[/red]")
-
-            try:
-                asyncio.run(stream_logs())
-            except KeyboardInterrupt:
-                console.print("\n[dim]Stopped.[/dim]")
-
     except httpx.ConnectError:
         console.print(f"[bold red]Error:[/bold red] Could not connect to {server}")
         console.print("[dim]Is the logtap server running? Start it with 'logtap serve'[/dim]")
@@ -119,3 +102,88 @@ def tail(
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
+
+
+def _follow(
+    server: str,
+    filename: str,
+    backlog: int,
+    api_key: Optional[str],
+    sample: Optional[str] = None,
+    max_rate: Optional[float] = None,
+) -> None:
+    """Stream the last lines of a file and then new entries via WebSocket."""
+    import asyncio
+    from urllib.parse import urlencode
+
+    async def stream_logs():
+        import websockets
+
+        ws_url = server.replace("http://", "ws://").replace("https://", "wss://")
+        params = {"filename": filename, "backlog": backlog}
+        if sample:
+            params["sample"] = sample
+        if max_rate:
+            params["max_lines_per_sec"] = max_rate
+        # Sampled streams send JSON frames with a count of skipped lines
+        sampled = "sample" in params or "max_lines_per_sec" in params
+        query = urlencode(params)
+        ws_url = f"{ws_url}/logs/stream?{query}"
+
+        extra_headers = {}
+        if api_key:
+            extra_headers["X-API-Key"] = api_key
+
+        first = True
+        try:
+            async with websockets.connect(ws_url, extra_headers=extra_headers) as ws:
+                async for message in ws:
+                    if first:
+                        first = False
+                        error = _stream_error(message)
+                        if error:
+                            console.print(f"[bold red]Error:[/bold red] {error}")
+                            return
+                    if sampled:
+                        _print_sampled_frame(message)
+                    else:
+                        console.print(message)
+        except websockets.exceptions.InvalidStatusCode as e:
+            if e.status_code == 404:
+                console.print("[yellow]Streaming not available.[/yellow]")
+                console.print("[dim]Server may need updating.[/dim]")
+            else:
+                console.print(f"[red]WebSocket error: {e}[/red]")
+        except OSError:
+            console.print(f"[bold red]Error:[/bold red] Could not connect to {server}")
+            console.print("[dim]Is the logtap server running? Start it with 'logtap serve'[/dim]")
+        except Exception as e:
+            console.print(f"[red]Streaming error: {e}[/red]")
+
+    try:
+        asyncio.run(stream_logs())
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped.[/dim]")
+
+
+def _print_sampled_frame(message: str) -> None:
+    """Print the lines of a sampled stream frame and how many were skipped."""
+    frame = json.loads(message)
+    for line in frame.get("lines", []):
+        console.print(line)
+    suppressed = frame.get("suppressed", 0)
+    if suppressed:
+        console.print(f"[dim]... {suppressed} lines suppressed[/dim]")
+
+
+def _stream_error(message: str) -> Optional[str]:
+    """Return the error from a stream's first message, if it is an error frame."""
+    if not message.startswith('{"error"'):
+        return None
+    try:
+        data = json.loads(message)
+    except ValueError:
+        return None
+    if isinstance(data, dict) and set(data) == {"error"}:
+        return str(data["error"])
+    return None
@@ -1,16 +1,31 @@
 """Core business logic for logtap."""
 
-from logtap.core.reader import get_file_lines, get_file_lines_async, tail, tail_async
+from logtap.core.reader import (
+    get_file_lines,
+    get_file_lines_async,
+    read_from_offset,
+    read_from_offset_async,
+    tail,
+    tail_async,
+)
 from logtap.core.search import filter_lines
-from logtap.core.validation import is_filename_valid, is_limit_valid, is_search_term_valid
+from logtap.core.validation import (
+    is_filename_valid,
+    is_limit_valid,
+    is_pattern_valid,
+    is_search_term_valid,
+)
 
 __all__ = [
     "tail",
     "tail_async",
     "get_file_lines",
     "get_file_lines_async",
+    "read_from_offset",
+    "read_from_offset_async",
     "is_filename_valid",
     "is_search_term_valid",
     "is_limit_valid",
+    "is_pattern_valid",
     "filter_lines",
 ]
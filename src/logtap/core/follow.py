@@ -0,0 +1,170 @@
+"""
+Live following of log files for logtap.
+
+FileFollower reads new complete lines from a byte offset, parking on the shared
+FileWatcher between writes. TailWindow keeps the last lines of a file warm in
+memory together with the exact offset they end at, so a stream can send a
+backlog and then follow from that offset without losing or repeating lines.
+"""
+
+import asyncio
+import weakref
+from collections import OrderedDict, deque
+from typing import Deque, List, Optional, Tuple
+
+from logtap.core.reader import read_from_offset_async, read_last_lines
+from logtap.core.watcher import get_file_state, get_watcher
+
+
+class FileFollower:
+    """
+    Reads lines appended to a file after a byte offset.
+
+    Truncation is detected by the file shrinking below the current offset, in
+    which case following restarts from the beginning of the file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        offset: int,
+        max_lines: int = 500,
+        interval: float = 0.25,
+    ):
+        self.path = path
+        self.offset = offset
+        self.max_lines = max_lines
+        self.interval = interval
+        self._seen_size = offset
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait for and return the next batch of complete lines.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits forever.
+
+        Returns:
+            Up to max_lines new lines, or an empty list if the timeout expired.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        watcher = get_watcher(self.path, interval=self.interval)
+
+        while True:
+            state = get_file_state(self.path)
+            if state is not None and state[2] != self._seen_size:
+                size = state[2]
+                if size < self.offset:
+                    self.offset = 0
+                lines, self.offset = await read_from_offset_async(
+                    self.path, self.offset, max_lines=self.max_lines
+                )
+                # A capped batch leaves lines behind; keep the size unseen so we come back
+                if self.offset >= size or not lines:
+                    self._seen_size = size
+                if lines:
+                    return lines
+
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return []
+            if not await watcher.wait_for_change(self._seen_size, timeout=remaining):
+                return []
+
+
+class TailWindow:
+    """
+    The last lines of a file, kept current incrementally.
+
+    Concurrent snapshots share a single refresh, so many clients connecting at
+    once cost one read of the new bytes rather than one tail each.
+    """
+
+    RELOAD_THRESHOLD = 4 * 1024 * 1024
+
+    def __init__(self, path: str, max_lines: int = 1000):
+        self.path = path
+        self.max_lines = max_lines
+        self._lines: Deque[str] = deque(maxlen=max_lines)
+        self._offset = 0
+        self._identity: Optional[Tuple[int, int]] = None
+        self._lock = asyncio.Lock()
+
+    async def snapshot(self, lines_limit: int) -> Tuple[List[str], int]:
+        """
+        Get the last lines of the file and the offset they end at.
+
+        Args:
+            lines_limit: Number of lines to return, at most max_lines.
+
+        Returns:
+            A tuple of the last complete lines and the byte offset just past them.
+        """
+        async with self._lock:
+            await self._refresh()
+            lines = list(self._lines)
+            offset = self._offset
+        if lines_limit <= 0:
+            return [], offset
+        return lines[-lines_limit:], offset
+
+    async def _refresh(self) -> None:
+        """Bring the window up to date with the file."""
+        state = get_file_state(self.path)
+        if state is None:
+            raise FileNotFoundError(self.path)
+        identity, size = (state[0], state[1]), state[2]
+
+        # Re-tail rather than read forward if the file was replaced or grew a lot
+        if (
+            identity != self._identity
+            or size < self._offset
+            or size - self._offset > self.RELOAD_THRESHOLD
+        ):
+            await self._reload(identity)
+            return
+
+        while self._offset < size:
+            before = self._offset
+            lines, self._offset = await read_from_offset_async(self.path, self._offset)
+            self._lines.extend(lines)
+            if self._offset == before:
+                break  # Only a partial line is waiting
+
+    async def _reload(self, identity: Tuple[int, int]) -> None:
+        """Load the window from scratch, reading backwards from the end."""
+        lines, offset = await asyncio.to_thread(read_last_lines, self.path, self.max_lines)
+        self._lines = deque(lines, maxlen=self.max_lines)
+        self._offset = offset
+        self._identity = identity
+
+
+_windows: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict[str, TailWindow]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_tail_window(path: str, max_lines: int = 1000, cache_size: int = 256) -> TailWindow:
+    """
+    Get the shared tail window for a path on the running event loop.
+
+    The least recently used windows are evicted beyond cache_size.
+
+    Args:
+        path: Path to the file.
+        max_lines: Number of lines a newly created window keeps.
+        cache_size: Maximum number of windows kept in memory.
+
+    Returns:
+        The TailWindow for this path.
+    """
+    windows = _windows.setdefault(asyncio.get_running_loop(), OrderedDict())
+    window = windows.get(path)
+    if window is None or window.max_lines < max_lines:
+        window = TailWindow(path, max_lines=max_lines)
+        windows[path] = window
+    windows.move_to_end(path)
+    while len(windows) > cache_size:
+        windows.popitem(last=False)
+    return window
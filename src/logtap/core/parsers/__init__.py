@@ -1,7 +1,7 @@
 """Log format parsers for logtap."""
 
 from logtap.core.parsers.apache import ApacheParser
-from logtap.core.parsers.auto import AutoParser, detect_format
+from logtap.core.parsers.auto import AutoParser, detect_file_format, detect_format
 from logtap.core.parsers.base import LogLevel, LogParser, ParsedLogEntry
 from logtap.core.parsers.json_parser import JsonLogParser
 from logtap.core.parsers.nginx import NginxParser
@@ -17,4 +17,5 @@ __all__ = [
     "ApacheParser",
     "AutoParser",
     "detect_format",
+    "detect_file_format",
 ]
@@ -1,12 +1,15 @@
 """Auto-detection and parsing of log formats."""
 
-from typing import List, Optional, Type
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Type
 
 from logtap.core.parsers.apache import ApacheParser
 from logtap.core.parsers.base import LogParser, ParsedLogEntry
 from logtap.core.parsers.json_parser import JsonLogParser
 from logtap.core.parsers.nginx import NginxParser
 from logtap.core.parsers.syslog import SyslogParser
+from logtap.core.reader import read_last_lines
+from logtap.core.watcher import get_file_state
 
 # Parser priority order (more specific formats first)
 PARSERS: List[Type[LogParser]] = [
@@ -51,16 +54,58 @@ def detect_format(lines: List[str], sample_size: int = 10) -> Optional[LogParser
     return best_parser_cls()
 
 
+# Detected parser class per (device, inode), most recently used last
+_file_formats: "OrderedDict[Tuple[int, int], Type[LogParser]]" = OrderedDict()
+FILE_FORMAT_CACHE_SIZE = 1024
+
+
+def detect_file_format(path: str, sample_size: int = 20) -> Optional[LogParser]:
+    """
+    Detect the log format of a file, caching the result per file.
+
+    Detection samples the last lines of the file once; later calls for the same
+    file (same device and inode) reuse the result until it is rotated away.
+
+    Args:
+        path: Path to the log file.
+        sample_size: Number of lines to sample for detection.
+
+    Returns:
+        A LogParser instance for the file's format, or None if undetectable.
+    """
+    state = get_file_state(path)
+    if state is None:
+        return None
+    identity = (state[0], state[1])
+
+    parser_cls = _file_formats.get(identity)
+    if parser_cls is None:
+        lines, _ = read_last_lines(path, sample_size)
+        parser = detect_format(lines, sample_size=sample_size)
+        if parser is None:
+            # Nothing recognisable yet (e.g. empty file); try again next time
+            return None
+        parser_cls = type(parser)
+        _file_formats[identity] = parser_cls
+        while len(_file_formats) > FILE_FORMAT_CACHE_SIZE:
+            _file_formats.popitem(last=False)
+
+    _file_formats.move_to_end(identity)
+    return parser_cls()
+
+
 class AutoParser(LogParser):
     """
     Parser that auto-detects the log format.
 
     On first parse, it samples lines to detect the format,
     then uses the appropriate parser for subsequent lines.
+    Passing a parser pins the format and skips detection entirely.
     """
 
-    def __init__(self):
-        self._detected_parser: Optional[LogParser] = None
+    def __init__(self, parser: Optional[LogParser] = None):
+        self._detected_parser: Optional[LogParser] = parser
+        self._pinned = parser is not None
         self._parsers = [cls() for cls in PARSERS]
 
     @property
@@ -108,7 +153,8 @@ class AutoParser(LogParser):
             return []
 
         # Detect format from sample
-        self._detected_parser = detect_format(lines)
+        if not self._pinned:
+            self._detected_parser = detect_format(lines)
 
         # Parse all lines
         return [self.parse(line) for line in lines]
@@ -116,3 +162,4 @@ class AutoParser(LogParser):
     def reset(self):
         """Reset format detection."""
         self._detected_parser = None
+        self._pinned = False
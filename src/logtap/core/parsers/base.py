@@ -88,6 +88,17 @@ class ParsedLogEntry:
             "metadata": self.metadata,
         }
 
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """Convert to a small dictionary for streaming, omitting empty fields."""
+        compact: Dict[str, Any] = {"message": self.message}
+        if self.timestamp:
+            compact["ts"] = self.timestamp.isoformat()
+        if self.level:
+            compact["level"] = self.level.value
+        if self.source:
+            compact["source"] = self.source
+        return compact
+
 
 class LogParser(ABC):
     """Abstract base class for log parsers."""
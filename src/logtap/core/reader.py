@@ -108,6 +108,130 @@ async def tail_async(
         return lines[-lines_limit:]
 
 
+def _split_complete_lines(
+    data: bytes, offset: int, max_lines: Optional[int]
+) -> Tuple[List[str], int]:
+    """
+    Split raw bytes into complete lines, tracking the offset after the last one.
+
+    A trailing partial line (no newline yet) is left for the next read.
+    """
+    lines: List[str] = []
+    position = 0
+    while max_lines is None or len(lines) < max_lines:
+        newline = data.find(b"\n", position)
+        if newline == -1:
+            break
+        lines.append(data[position:newline].decode("utf-8", errors="replace"))
+        position = newline + 1
+    return lines, offset + position
+
+
+def read_from_offset(
+    filename: str,
+    offset: int,
+    max_bytes: int = 1024 * 1024,
+    max_lines: Optional[int] = None,
+) -> Tuple[List[str], int]:
+    """
+    Read complete lines written after a byte offset.
+
+    Args:
+        filename: The path to the file to be read.
+        offset: Byte offset to start reading from.
+        max_bytes: Maximum number of bytes to read. Defaults to 1 MiB.
+        max_lines: Maximum number of lines to return. None means no limit.
+
+    Returns:
+        A tuple of the complete lines read and the byte offset just past the
+        last returned line, suitable for the next call.
+    """
+    with open(filename, "rb") as f:
+        f.seek(offset)
+        data = f.read(max_bytes)
+
+    lines, next_offset = _split_complete_lines(data, offset, max_lines)
+    if not lines and len(data) == max_bytes:
+        # A single line longer than max_bytes; return it in pieces rather than stall
+        return [data.decode("utf-8", errors="replace")], offset + len(data)
+    return lines, next_offset
+
+
+async def read_from_offset_async(
+    filename: str,
+    offset: int,
+    max_bytes: int = 1024 * 1024,
+    max_lines: Optional[int] = None,
+) -> Tuple[List[str], int]:
+    """
+    Async version of read_from_offset() for use with FastAPI.
+
+    Args:
+        filename: The path to the file to be read.
+        offset: Byte offset to start reading from.
+        max_bytes: Maximum number of bytes to read. Defaults to 1 MiB.
+        max_lines: Maximum number of lines to return. None means no limit.
+
+    Returns:
+        A tuple of the complete lines read and the byte offset just past the
+        last returned line, suitable for the next call.
+    """
+    async with aiofiles.open(filename, "rb") as f:
+        await f.seek(offset)
+        data = await f.read(max_bytes)
+
+    lines, next_offset = _split_complete_lines(data, offset, max_lines)
+    if not lines and len(data) == max_bytes:
+        return [data.decode("utf-8", errors="replace")], offset + len(data)
+    return lines, next_offset
+
+
+def read_last_lines(
+    filename: str, lines_limit: int = 50, block_size: int = 64 * 1024
+) -> Tuple[List[str], int]:
+    """
+    Reads the last 'lines_limit' complete lines of a file and where they end.
+
+    Unlike tail(), a trailing partial line (no newline yet) is excluded, and the
+    returned offset points just past the last returned line. Following the file
+    from that offset continues exactly where the returned lines stop.
+
+    Args:
+        filename: The path to the file to be read.
+        lines_limit: The maximum number of lines to be returned. Defaults to 50.
+        block_size: The number of bytes to read at a time. Defaults to 64 KiB.
+
+    Returns:
+        A tuple of the last complete lines and the byte offset they end at.
+    """
+    with open(filename, "rb") as f:
+        f.seek(0, SEEK_END)
+        size = f.tell()
+        data = b""
+        block_end_byte = size
+
+        # Read backwards until we hold the last newline plus lines_limit more,
+        # or reach the start of the file.
+        while block_end_byte > 0 and data.count(b"\n") <= lines_limit:
+            stepback = min(block_size, block_end_byte)
+            block_end_byte -= stepback
+            f.seek(block_end_byte)
+            data = f.read(stepback) + data
+
+    end = data.rfind(b"\n")
+    if end == -1:
+        return [], block_end_byte
+    end_offset = block_end_byte + end + 1
+    if lines_limit <= 0:
+        return [], end_offset
+
+    lines = data[:end].split(b"\n")
+    if block_end_byte > 0:
+        # The first piece may be the tail of a line that started before our data
+        lines = lines[1:]
+    return [line.decode("utf-8", errors="replace") for line in lines[-lines_limit:]], end_offset
+
+
 def get_file_lines(
     filepath: str,
     search_term: Optional[str] = None,
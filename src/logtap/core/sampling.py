@@ -0,0 +1,154 @@
+"""
+Sampling and rate limiting for live streams.
+
+A StreamSampler thins out batches of lines (or parsed entries) from very hot
+files and counts what it dropped, so a viewer stays responsive and can be told
+exactly how much was skipped.
+"""
+
+import random
+import re
+import time
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+SAMPLE_PATTERN = re.compile(r"^(?:1/)?(\d+)$")
+
+
+def parse_sample_rate(sample: str) -> int:
+    """
+    Parse a sampling rate like "1/10" (or just "10") into N.
+
+    Args:
+        sample: The sampling rate string.
+
+    Returns:
+        N, meaning one line in every N is kept.
+
+    Raises:
+        ValueError: If the string is not of the form 1/N with N >= 1.
+    """
+    match = SAMPLE_PATTERN.match(sample.strip())
+    if not match or int(match.group(1)) < 1:
+        raise ValueError(f"Invalid sample rate: {sample}. Expected 1/N, e.g. 1/10")
+    return int(match.group(1))
+
+
+class StreamSampler:
+    """
+    Applies 1-in-N sampling, a per-frame reservoir and a lines-per-second cap.
+
+    Stages run in that order. Dropped items are counted until the caller
+    collects the count with take_suppressed().
+    """
+
+    def __init__(
+        self,
+        every: int = 1,
+        max_per_sec: Optional[float] = None,
+        reservoir: Optional[int] = None,
+        flush_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        self.every = every
+        self.max_per_sec = max_per_sec
+        self.reservoir = reservoir
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._counter = 0
+        self._suppressed = 0
+        self._tokens = max_per_sec or 0.0
+        self._last_refill = clock()
+        self.flush_interval = flush_interval
+        self._last_flush = clock()
+
+    @property
+    def active(self) -> bool:
+        """Whether this sampler can drop anything."""
+        return self.every > 1 or self.max_per_sec is not None or self.reservoir is not None
+
+    def apply(self, items: List[T]) -> List[T]:
+        """
+        Thin out a batch.
+
+        Args:
+            items: The batch, in order.
+
+        Returns:
+            The kept items, in their original order.
+        """
+        kept = items
+        if self.every > 1:
+            # Keep every Nth item, counting across batches
+            start = (-self._counter) % self.every
+            self._counter += len(items)
+            kept = kept[start :: self.every]
+
+        if self.reservoir is not None and len(kept) > self.reservoir:
+            indexes = sorted(self._rng.sample(range(len(kept)), self.reservoir))
+            kept = [kept[i] for i in indexes]
+
+        if self.max_per_sec is not None:
+            now = self._clock()
+            # Allow a burst of up to one second's worth (at least one line)
+            self._tokens = min(
+                max(self.max_per_sec, 1.0),
+                self._tokens + (now - self._last_refill) * self.max_per_sec,
+            )
+            self._last_refill = now
+            allowed = int(self._tokens)
+            if len(kept) > allowed:
+                kept = kept[:allowed]
+            self._tokens -= len(kept)
+
+        self._suppressed += len(items) - len(kept)
+        return kept
+
+    def should_send(self, kept: List[T]) -> bool:
+        """
+        Decide whether a frame should go out for this batch.
+
+        Frames go out whenever something was kept. When everything is being
+        dropped, a frame carrying only the suppressed count goes out at most
+        once per flush_interval, so the viewer knows the stream is alive.
+        """
+        if kept:
+            return True
+        return self._suppressed > 0 and self._clock() - self._last_flush >= self.flush_interval
+
+    def take_suppressed(self) -> int:
+        """Return the number of items dropped since the last call and reset it."""
+        suppressed, self._suppressed = self._suppressed, 0
+        self._last_flush = self._clock()
+        return suppressed
+
+
+def build_sampler(
+    sample: Optional[str] = None,
+    max_lines_per_sec: Optional[float] = None,
+    reservoir: Optional[int] = None,
+) -> Optional[StreamSampler]:
+    """
+    Build a sampler from stream query parameters.
+
+    Args:
+        sample: Sampling rate of the form 1/N.
+        max_lines_per_sec: Maximum lines delivered per second.
+        reservoir: Maximum lines per frame, chosen uniformly at random.
+
+    Returns:
+        A StreamSampler, or None if no option would drop anything.
+
+    Raises:
+        ValueError: If any option is invalid.
+    """
+    every = parse_sample_rate(sample) if sample else 1
+    if max_lines_per_sec is not None and max_lines_per_sec <= 0:
+        raise ValueError("max_lines_per_sec must be greater than 0")
+    if reservoir is not None and reservoir < 1:
+        raise ValueError("reservoir must be at least 1")
+
+    sampler = StreamSampler(every=every, max_per_sec=max_lines_per_sec, reservoir=reservoir)
+    return sampler if sampler.active else None
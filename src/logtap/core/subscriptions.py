@@ -0,0 +1,169 @@
+"""
+Multi-file follow state for logtap.
+
+A Subscription tracks a set of filenames and glob patterns relative to the log
+directory, resolves them to files, and remembers a read offset for each file so
+new lines from all of them can be collected in a single batch.
+"""
+
+import glob
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple
+
+from logtap.core.reader import read_from_offset_async
+from logtap.core.validation import is_pattern_valid
+from logtap.core.watcher import get_file_state
+
+
+@dataclass
+class FollowedFile:
+    """Read position for one followed file."""
+
+    path: str  # Absolute path
+    offset: int  # Byte offset just past the last line sent
+    seen_size: int  # File size at the last read, used to skip unchanged files
+
+
+class Subscription:
+    """
+    A set of followed files resolved from filenames and glob patterns.
+
+    Files matched when a pattern is subscribed are followed from their end.
+    Files that appear later and match a pattern are followed from the start,
+    since everything in them is new.
+    """
+
+    def __init__(self, log_dir: str, max_files: int = 1000):
+        self.log_dir = log_dir
+        self.max_files = max_files
+        self.patterns: Set[str] = set()
+        self.files: Dict[str, FollowedFile] = {}
+        self._root = os.path.realpath(log_dir)
+
+    def subscribe(self, patterns: Iterable[str]) -> List[str]:
+        """
+        Add filenames or glob patterns to the subscription.
+
+        Args:
+            patterns: Filenames or glob patterns relative to the log directory.
+
+        Returns:
+            Names of files that started being followed.
+
+        Raises:
+            ValueError: If a pattern is invalid or too many files would be followed.
+        """
+        patterns = list(patterns)
+        for pattern in patterns:
+            if not is_pattern_valid(pattern):
+                raise ValueError(f"Invalid pattern: {pattern}")
+        previous = set(self.patterns)
+        self.patterns.update(patterns)
+        try:
+            return self.rescan(from_end=True)
+        except ValueError:
+            self.patterns = previous
+            raise
+
+    def unsubscribe(self, patterns: Iterable[str]) -> List[str]:
+        """
+        Remove filenames or glob patterns from the subscription.
+
+        Args:
+            patterns: Patterns previously passed to subscribe().
+
+        Returns:
+            Names of files that are no longer followed.
+        """
+        self.patterns.difference_update(patterns)
+        matched = self._match()
+        removed = [name for name in self.files if name not in matched]
+        for name in removed:
+            del self.files[name]
+        return sorted(removed)
+
+    def rescan(self, from_end: bool = False) -> List[str]:
+        """
+        Resolve patterns again, picking up new files and dropping deleted ones.
+
+        Args:
+            from_end: Start newly matched files at their end instead of the start.
+
+        Returns:
+            Names of files that started being followed.
+
+        Raises:
+            ValueError: If more than max_files files would be followed.
+        """
+        matched = self._match()
+        if len(matched) > self.max_files:
+            raise ValueError(f"Subscription matches more than {self.max_files} files")
+
+        for name in [name for name in self.files if name not in matched]:
+            del self.files[name]
+
+        added = []
+        for name, path in matched.items():
+            if name in self.files:
+                continue
+            state = get_file_state(path)
+            if state is None:
+                continue
+            start = state[2] if from_end else 0
+            self.files[name] = FollowedFile(path=path, offset=start, seen_size=start)
+            added.append(name)
+        return sorted(added)
+
+    def pending(self) -> List[Tuple[str, int]]:
+        """Get (path, size) pairs to wait on for changes."""
+        return [(f.path, f.seen_size) for f in self.files.values()]
+
+    async def read_batch(self, max_lines: int) -> List[Tuple[str, str]]:
+        """
+        Read new complete lines from all followed files.
+
+        Args:
+            max_lines: Maximum total number of lines to return.
+
+        Returns:
+            A list of (filename, line) tuples.
+        """
+        batch: List[Tuple[str, str]] = []
+        for name, followed in list(self.files.items()):
+            if len(batch) >= max_lines:
+                break
+            state = get_file_state(followed.path)
+            if state is None or state[2] == followed.seen_size:
+                continue
+            size = state[2]
+            if size < followed.offset:
+                # Truncated or rotated in place; follow the new contents
+                followed.offset = 0
+            lines, followed.offset = await read_from_offset_async(
+                followed.path, followed.offset, max_lines=max_lines - len(batch)
+            )
+            # Only mark the size as seen once everything up to it has been read
+            if followed.offset >= size or not lines:
+                followed.seen_size = size
+            batch.extend((name, line) for line in lines)
+        return batch
+
+    def _match(self) -> Dict[str, str]:
+        """Resolve patterns to a mapping of relative name to absolute path."""
+        matched: Dict[str, str] = {}
+        for pattern in self.patterns:
+            if any(c in pattern for c in "*?["):
+                candidates = glob.glob(os.path.join(self.log_dir, pattern))
+            else:
+                candidates = [os.path.join(self.log_dir, pattern)]
+            for path in candidates:
+                if not os.path.isfile(path) or not self._is_inside(path):
+                    continue
+                matched[os.path.relpath(path, self.log_dir)] = path
+        return matched
+
+    def _is_inside(self, path: str) -> bool:
+        """Check that a path does not escape the log directory via symlinks."""
+        real = os.path.realpath(path)
+        return os.path.commonpath([self._root, real]) == self._root
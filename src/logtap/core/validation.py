@@ -50,3 +50,25 @@ def is_limit_valid(limit: int) -> bool:
         True if limit is valid, False otherwise.
     """
     return 1 <= limit <= 1000
+
+
+def is_pattern_valid(pattern: str) -> bool:
+    """
+    Validates a relative filename or glob pattern used for subscriptions.
+
+    Unlike plain filenames, patterns may use "/" to reach subdirectories of the
+    log directory (e.g. "nginx/*.log"), but must still be relative and must not
+    contain ".." or backslashes.
+
+    Args:
+        pattern: The filename or glob pattern to be checked.
+
+    Returns:
+        True if pattern is valid, False otherwise.
+    """
+    return (
+        bool(pattern)
+        and is_filename_valid(pattern)
+        and "\\" not in pattern
+        and "\x00" not in pattern
+    )
@@ -0,0 +1,133 @@
+"""
+File change notification for logtap.
+
+Each watched path gets a single FileWatcher per event loop. The watcher stats the
+file on one background task and wakes every waiter at once when the file changes,
+so thousands of idle pollers cost a parked coroutine each rather than a loop each.
+The task stops as soon as nobody is waiting.
+"""
+
+import asyncio
+import os
+import weakref
+from typing import Dict, Optional, Tuple
+
+# (device, inode, size, mtime_ns) - enough to spot appends, truncation and rotation
+FileState = Tuple[int, int, int, int]
+
+
+def get_file_state(path: str) -> Optional[FileState]:
+    """
+    Get the identity and size of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        A (device, inode, size, mtime_ns) tuple, or None if the file is missing.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class FileWatcher:
+    """
+    Shared change notifier for a single file.
+
+    Use get_watcher() rather than creating instances directly so that all
+    waiters on the same path share one stat loop.
+    """
+
+    def __init__(self, path: str, interval: float = 0.25):
+        self.path = path
+        self.interval = interval
+        self._event = asyncio.Event()
+        self._state = get_file_state(path)
+        self._waiters = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def waiters(self) -> int:
+        """Number of coroutines currently parked on this watcher."""
+        return self._waiters
+
+    async def wait_for_change(self, offset: int, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the file size no longer matches a known offset.
+
+        Returns immediately if the file already grew (or shrank) past the offset,
+        which closes the gap between a caller's last read and this wait.
+
+        Args:
+            offset: Byte offset the caller has already read up to.
+            timeout: Maximum seconds to wait. None waits forever.
+
+        Returns:
+            True if the file changed, False if the timeout expired.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        self._waiters += 1
+        try:
+            while True:
+                state = get_file_state(self.path)
+                if state is None or state[2] != offset:
+                    return True
+
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+
+                self._ensure_running()
+                try:
+                    await asyncio.wait_for(self._event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return False
+        finally:
+            self._waiters -= 1
+
+    def _ensure_running(self) -> None:
+        """Start the stat loop if it is not already running."""
+        if self._task is None or self._task.done():
+            self._state = get_file_state(self.path)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Stat the file periodically and wake waiters when it changes."""
+        while self._waiters > 0:
+            await asyncio.sleep(self.interval)
+            state = get_file_state(self.path)
+            if state != self._state:
+                self._state = state
+                # Swap in a fresh event before waking so woken waiters park on it
+                event, self._event = self._event, asyncio.Event()
+                event.set()
+
+
+_watchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, FileWatcher]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_watcher(path: str, interval: float = 0.25) -> FileWatcher:
+    """
+    Get the shared watcher for a path on the running event loop.
+
+    Args:
+        path: Path to the file to watch.
+        interval: Seconds between stat checks for a newly created watcher.
+
+    Returns:
+        The FileWatcher for this path.
+    """
+    loop = asyncio.get_running_loop()
+    watchers = _watchers.setdefault(loop, {})
+    watcher = watchers.get(path)
+    if watcher is None:
+        watcher = FileWatcher(path, interval=interval)
+        watchers[path] = watcher
+    return watcher
@@ -1,10 +1,11 @@
 """Pydantic models for logtap API requests and responses."""
 
 from logtap.models.config import Settings
-from logtap.models.responses import ErrorResponse, FileListResponse, LogResponse
+from logtap.models.responses import ErrorResponse, FileListResponse, LogResponse, PollResponse
 
 __all__ = [
     "LogResponse",
+    "PollResponse",
     "ErrorResponse",
     "FileListResponse",
     "Settings",
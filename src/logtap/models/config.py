@@ -34,6 +34,16 @@ class Settings(BaseSettings):
     default_limit: int = 50
     max_limit: int = 1000
 
+    # Long-poll and streaming
+    watch_interval: float = 0.25
+    poll_max_wait: float = 60.0
+    stream_batch_lines: int = 500
+    sse_heartbeat_interval: float = 15.0
+    tail_window_lines: int = 1000
+    tail_window_cache_size: int = 256
+    subscribe_rescan_interval: float = 2.0
+    subscribe_max_files: int = 1000
+
     def get_log_directory(self) -> str:
         """Get the log directory. Uses log_directory setting directly."""
         return self.log_directory
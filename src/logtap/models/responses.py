@@ -26,6 +26,33 @@ class LogResponse(BaseModel):
     }
 
 
+class PollResponse(BaseModel):
+    """Response model for long-poll log queries."""
+
+    lines: List[str] = Field(description="Complete lines written after the requested offset")
+    count: int = Field(description="Number of lines returned")
+    filename: str = Field(description="Name of the log file queried")
+    offset: int = Field(description="Byte offset the lines were read from")
+    next_offset: int = Field(description="Byte offset to pass as 'after' on the next poll")
+    truncated: bool = Field(
+        default=False,
+        description="True if the file shrank below the requested offset and was re-read from 0",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "lines": ["Jan  8 10:23:47 server sshd[1234]: Disconnected"],
+                "count": 1,
+                "filename": "syslog",
+                "offset": 10240,
+                "next_offset": 10291,
+                "truncated": False,
+            }
+        }
+    }
+
+
 class ErrorResponse(BaseModel):
     """Response model for errors."""
 
@@ -4,6 +4,8 @@ These tests cover the same cases as the original test_app.py from UnixLogMonitor
 migrated to pytest and FastAPI.
 """
 
+import threading
+import time
 from http import HTTPStatus
 
 import pytest
@@ -147,6 +149,60 @@ class TestLogsEndpoint:
         assert len(data["lines"]) == 3
 
 
+class TestPollEndpoint:
+    """Tests for GET /logs/poll endpoint."""
+
+    def test_poll_returns_lines_after_offset(self, client, log_file):
+        """Test that lines after the offset are returned immediately."""
+        filename = log_file(["line 1", "line 2", "line 3", ""])
+        response = client.get("/logs/poll", params={"filename": filename, "after": 7})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data["lines"] == ["line 2", "line 3"]
+        assert data["offset"] == 7
+        assert data["next_offset"] == 21
+
+    def test_poll_timeout_returns_empty(self, client, log_file):
+        """Test that a poll at EOF returns nothing once the wait expires."""
+        filename = log_file(["line 1", ""])
+        response = client.get("/logs/poll", params={"filename": filename, "wait": 0.2})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data["lines"] == []
+        assert data["next_offset"] == 7
+
+    def test_poll_wakes_on_append(self, client, log_file, test_log_dir):
+        """Test that a waiting poll returns as soon as a line is appended."""
+        filename = log_file(["line 1", ""])
+
+        def append():
+            time.sleep(0.3)
+            with open(test_log_dir / filename, "a", encoding="utf-8") as f:
+                f.write("line 2\n")
+
+        writer = threading.Thread(target=append)
+        writer.start()
+        started = time.monotonic()
+        response = client.get("/logs/poll", params={"filename": filename, "after": 7, "wait": 10})
+        writer.join()
+
+        assert response.json()["lines"] == ["line 2"]
+        assert time.monotonic() - started < 5
+
+    def test_poll_truncated_file(self, client, log_file):
+        """Test that an offset past EOF restarts from the beginning."""
+        filename = log_file(["line 1", ""])
+        response = client.get("/logs/poll", params={"filename": filename, "after": 500})
+        data = response.json()
+        assert data["truncated"] is True
+        assert data["lines"] == ["line 1"]
+
+    def test_poll_invalid_filename(self, client):
+        """Test that path traversal is rejected."""
+        response = client.get("/logs/poll", params={"filename": "../etc/passwd"})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 class TestFilesEndpoint:
     """Tests for GET /files endpoint."""
 
@@ -0,0 +1,200 @@
+"""Integration tests for logtap streaming endpoints."""
+
+import pytest
+
+from logtap.api.dependencies import get_settings
+
+
+@pytest.fixture
+def fast_settings(monkeypatch):
+    """Shorten watch and rescan intervals so streaming tests run quickly."""
+    monkeypatch.setenv("LOGTAP_WATCH_INTERVAL", "0.01")
+    monkeypatch.setenv("LOGTAP_SUBSCRIBE_RESCAN_INTERVAL", "0.05")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def append(path, *lines):
+    """Append complete lines to a log file."""
+    with open(path, "a", encoding="utf-8") as f:
+        for line in lines:
+            f.write(f"{line}\n")
+
+
+def receive_lines(ws, count):
+    """Receive frames until at least count lines have arrived."""
+    received = []
+    while len(received) < count:
+        message = ws.receive_json()
+        if message["type"] == "lines":
+            received.extend(message["lines"])
+    return received
+
+
+class TestSubscribeEndpoint:
+    """Tests for the /logs/subscribe WebSocket."""
+
+    def test_subscribe_multiple_files(self, client, test_log_dir, fast_settings):
+        """Test that lines from several files arrive tagged with their source."""
+        append(test_log_dir / "a.log", "old a")
+        append(test_log_dir / "b.log", "old b")
+
+        with client.websocket_connect("/logs/subscribe") as ws:
+            ws.send_json({"action": "subscribe", "files": ["a.log", "b.log"]})
+            ack = ws.receive_json()
+            assert ack["type"] == "subscribed"
+            assert ack["files"] == ["a.log", "b.log"]
+
+            append(test_log_dir / "a.log", "new a")
+            append(test_log_dir / "b.log", "new b")
+            lines = receive_lines(ws, 2)
+
+        assert {(entry["file"], entry["line"]) for entry in lines} == {
+            ("a.log", "new a"),
+            ("b.log", "new b"),
+        }
+
+    def test_glob_picks_up_new_files(self, client, test_log_dir, fast_settings):
+        """Test that files created after subscribing are followed from the start."""
+        (test_log_dir / "nginx").mkdir()
+        append(test_log_dir / "nginx" / "access.log", "existing")
+
+        with client.websocket_connect("/logs/subscribe") as ws:
+            ws.send_json({"action": "subscribe", "files": ["nginx/*.log"]})
+            assert ws.receive_json()["files"] == ["nginx/access.log"]
+
+            append(test_log_dir / "nginx" / "error.log", "first error")
+            message = ws.receive_json()
+            while message["type"] != "added":
+                message = ws.receive_json()
+            assert message["files"] == ["nginx/error.log"]
+
+            lines = receive_lines(ws, 1)
+
+        assert lines == [{"file": "nginx/error.log", "line": "first error"}]
+
+    def test_unsubscribe(self, client, test_log_dir, fast_settings):
+        """Test that unsubscribing stops following files."""
+        append(test_log_dir / "a.log", "old a")
+
+        with client.websocket_connect("/logs/subscribe") as ws:
+            ws.send_json({"action": "subscribe", "files": ["*.log"]})
+            ws.receive_json()
+            ws.send_json({"action": "unsubscribe", "files": ["*.log"]})
+            ack = ws.receive_json()
+
+        assert ack["type"] == "unsubscribed"
+        assert ack["files"] == ["a.log"]
+        assert ack["patterns"] == []
+
+    def test_invalid_pattern(self, client, fast_settings):
+        """Test that path traversal patterns are rejected."""
+        with client.websocket_connect("/logs/subscribe") as ws:
+            ws.send_json({"action": "subscribe", "files": ["../*"]})
+            message = ws.receive_json()
+
+        assert message["type"] == "error"
+        assert "Invalid pattern" in message["error"]
+
+
+class TestStreamBacklog:
+    """Tests for the backlog handoff on /logs/stream."""
+
+    def test_backlog_then_follow(self, client, test_log_dir, fast_settings):
+        """Test that the backlog is followed by new lines with no gap."""
+        append(test_log_dir / "app.log", *[f"line {i}" for i in range(5)])
+
+        with client.websocket_connect("/logs/stream?filename=app.log&backlog=3") as ws:
+            assert [ws.receive_text() for _ in range(3)] == ["line 2", "line 3", "line 4"]
+            append(test_log_dir / "app.log", "line 5")
+            assert ws.receive_text() == "line 5"
+
+    def test_partial_line_is_sent_once_complete(self, client, test_log_dir, fast_settings):
+        """Test that a line being written during connect is neither lost nor split."""
+        with open(test_log_dir / "app.log", "w") as f:
+            f.write("line 1\nline")
+
+        with client.websocket_connect("/logs/stream?filename=app.log&backlog=10") as ws:
+            assert ws.receive_text() == "line 1"
+            with open(test_log_dir / "app.log", "a") as f:
+                f.write(" 2\n")
+            assert ws.receive_text() == "line 2"
+
+    def test_stream_file_not_found(self, client, fast_settings):
+        """Test that a missing file reports an error."""
+        with client.websocket_connect("/logs/stream?filename=missing.log") as ws:
+            assert "File not found" in ws.receive_json()["error"]
+
+
+class TestParsedStream:
+    """Tests for the /parsed/stream WebSocket."""
+
+    def test_level_filter(self, client, test_log_dir, fast_settings):
+        """Test that only entries at or above the level are sent, compactly."""
+        append(test_log_dir / "app.json", '{"level": "info", "message": "boot"}')
+
+        with client.websocket_connect("/parsed/stream?filename=app.json&level=WARNING") as ws:
+            append(
+                test_log_dir / "app.json",
+                '{"level": "debug", "message": "noise"}',
+                '{"level": "error", "message": "disk full", "service": "api"}',
+            )
+            frame = ws.receive_json()
+
+        assert frame["entries"] == [{"message": "disk full", "level": "ERROR", "source": "api"}]
+
+    def test_backlog_and_term(self, client, test_log_dir, fast_settings):
+        """Test that the backlog is filtered by term like live lines."""
+        append(
+            test_log_dir / "app.json",
+            '{"level": "error", "message": "db timeout"}',
+            '{"level": "error", "message": "cache miss"}',
+        )
+
+        with client.websocket_connect("/parsed/stream?filename=app.json&backlog=10&term=db") as ws:
+            frame = ws.receive_json()
+
+        assert [e["message"] for e in frame["entries"]] == ["db timeout"]
+
+    def test_invalid_level(self, client, test_log_dir, fast_settings):
+        """Test that an invalid level reports an error."""
+        append(test_log_dir / "app.json", "{}")
+        with client.websocket_connect("/parsed/stream?filename=app.json&level=LOUD") as ws:
+            assert "Invalid level" in ws.receive_json()["error"]
+
+
+class TestStreamSampling:
+    """Tests for sampling options on the stream endpoints."""
+
+    def test_sampled_frames_count_suppressed(self, client, test_log_dir, fast_settings):
+        """Test that a sampled stream reports how many lines it skipped."""
+        append(test_log_dir / "hot.log", *[f"line {i}" for i in range(10)])
+
+        with client.websocket_connect(
+            "/logs/stream?filename=hot.log&backlog=10&sample=1/5"
+        ) as ws:
+            frame = ws.receive_json()
+
+        assert frame == {"lines": ["line 0", "line 5"], "suppressed": 8}
+
+    def test_invalid_sample(self, client, test_log_dir, fast_settings):
+        """Test that an invalid sample rate reports an error."""
+        append(test_log_dir / "hot.log", "line")
+        with client.websocket_connect("/logs/stream?filename=hot.log&sample=2/3") as ws:
+            assert "Invalid sample rate" in ws.receive_json()["error"]
+
+    def test_parsed_stream_rate_limit(self, client, test_log_dir, fast_settings):
+        """Test that the parsed stream applies max_lines_per_sec to matching entries."""
+        append(
+            test_log_dir / "app.json",
+            *[f'{{"level": "error", "message": "e{i}"}}' for i in range(20)],
+        )
+
+        with client.websocket_connect(
+            "/parsed/stream?filename=app.json&backlog=20&max_lines_per_sec=3"
+        ) as ws:
+            frame = ws.receive_json()
+
+        assert [e["message"] for e in frame["entries"]] == ["e0", "e1", "e2"]
+        assert frame["suppressed"] == 17
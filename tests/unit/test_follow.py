@@ -0,0 +1,72 @@
+"""Unit tests for logtap.core.follow module."""
+
+from pathlib import Path
+
+from logtap.core.follow import FileFollower, TailWindow
+
+
+class TestTailWindow:
+    """Tests for TailWindow."""
+
+    async def test_snapshot_returns_last_lines_and_offset(self, tmp_path: Path):
+        """Test that a snapshot ends exactly at the last complete line."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("a\nb\nc\npartial")
+
+        lines, offset = await TailWindow(str(log_file)).snapshot(2)
+        assert lines == ["b", "c"]
+        assert offset == 6
+
+    async def test_snapshot_refreshes_incrementally(self, tmp_path: Path):
+        """Test that appended lines show up in later snapshots."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("a\n")
+        window = TailWindow(str(log_file), max_lines=2)
+        await window.snapshot(2)
+
+        with open(log_file, "a") as f:
+            f.write("b\nc\n")
+
+        assert await window.snapshot(5) == (["b", "c"], 6)
+
+    async def test_snapshot_reloads_after_truncation(self, tmp_path: Path):
+        """Test that a truncated file is re-read from scratch."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("a\nb\nc\n")
+        window = TailWindow(str(log_file))
+        await window.snapshot(3)
+
+        log_file.write_text("x\n")
+        assert await window.snapshot(3) == (["x"], 2)
+
+
+class TestFileFollower:
+    """Tests for FileFollower."""
+
+    async def test_next_batch_returns_new_lines(self, tmp_path: Path):
+        """Test that lines after the offset are returned."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("a\nb\n")
+
+        follower = FileFollower(str(log_file), 2, interval=0.01)
+        assert await follower.next_batch(timeout=1) == ["b"]
+        assert follower.offset == 4
+
+    async def test_next_batch_timeout(self, tmp_path: Path):
+        """Test that no new lines returns an empty batch after the timeout."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("a\n")
+
+        follower = FileFollower(str(log_file), 2, interval=0.01)
+        assert await follower.next_batch(timeout=0.05) == []
+
+    async def test_next_batch_waits_for_complete_line(self, tmp_path: Path):
+        """Test that a partial line is held back until it is complete."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("a\npart")
+
+        follower = FileFollower(str(log_file), 2, interval=0.01)
+        assert await follower.next_batch(timeout=0.05) == []
+        with open(log_file, "a") as f:
+            f.write("ial\n")
+        assert await follower.next_batch(timeout=1) == ["partial"]
@@ -10,6 +10,7 @@ from logtap.core.parsers import (
     NginxParser,
     ApacheParser,
     AutoParser,
+    detect_file_format,
     detect_format,
 )
 
@@ -184,3 +185,34 @@ class TestDetectFormat:
 
     def test_detect_empty_returns_none(self):
         assert detect_format([]) is None
+
+
+class TestDetectFileFormat:
+    """Tests for detect_file_format()."""
+
+    def test_detects_and_caches_per_file(self, tmp_path, monkeypatch):
+        log_file = tmp_path / "app.log"
+        log_file.write_text('{"level": "info", "message": "a"}\n')
+
+        assert isinstance(detect_file_format(str(log_file)), JsonLogParser)
+
+        # A cached result must not re-read the file
+        from logtap.core.parsers import auto
+
+        monkeypatch.setattr(auto, "read_last_lines", None)
+        assert isinstance(detect_file_format(str(log_file)), JsonLogParser)
+
+    def test_empty_file_is_not_cached(self, tmp_path):
+        log_file = tmp_path / "empty.log"
+        log_file.write_text("")
+        assert detect_file_format(str(log_file)) is None
+
+    def test_pinned_auto_parser_skips_detection(self):
+        parser = AutoParser(JsonLogParser())
+        entries = parser.parse_many(['{"msg": "x"}'])
+        assert parser.name == "auto:json"
+        assert entries[0].message == "x"
+
+    def test_compact_dict_omits_empty_fields(self):
+        entry = ParsedLogEntry(raw="x", message="x", level=LogLevel.ERROR)
+        assert entry.to_compact_dict() == {"message": "x", "level": "ERROR"}
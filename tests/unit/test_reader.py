@@ -6,7 +6,13 @@ from pathlib import Path
 
 import pytest
 
-from logtap.core.reader import tail, read_block, get_file_lines
+from logtap.core.reader import (
+    get_file_lines,
+    read_block,
+    read_from_offset,
+    read_last_lines,
+    tail,
+)
 
 
 class TestTail:
@@ -107,3 +113,71 @@ class TestGetFileLines:
 
         result = get_file_lines(str(log_file), search_term="ö", num_lines_to_return=10)
         assert result == lines
+
+
+class TestReadFromOffset:
+    """Tests for the read_from_offset() function."""
+
+    def test_reads_complete_lines(self, tmp_path: Path):
+        """Test that only complete lines are returned."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\nline 2\npartial")
+
+        lines, next_offset = read_from_offset(str(log_file), 0)
+        assert lines == ["line 1", "line 2"]
+        assert next_offset == 14
+
+    def test_resumes_from_offset(self, tmp_path: Path):
+        """Test that reading resumes exactly where the previous read stopped."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\nline 2\n")
+
+        lines, next_offset = read_from_offset(str(log_file), 7)
+        assert lines == ["line 2"]
+        assert next_offset == 14
+
+    def test_max_lines(self, tmp_path: Path):
+        """Test that max_lines stops early with a matching offset."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("a\nb\nc\n")
+
+        lines, next_offset = read_from_offset(str(log_file), 0, max_lines=2)
+        assert lines == ["a", "b"]
+        assert next_offset == 4
+
+    def test_long_line_does_not_stall(self, tmp_path: Path):
+        """Test that a line longer than max_bytes is returned in pieces."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("x" * 100)
+
+        lines, next_offset = read_from_offset(str(log_file), 0, max_bytes=10)
+        assert lines == ["x" * 10]
+        assert next_offset == 10
+
+
+class TestReadLastLines:
+    """Tests for the read_last_lines() function."""
+
+    def test_excludes_partial_line(self, tmp_path: Path):
+        """Test that an unterminated last line is left out."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\nline 2\npartial")
+
+        assert read_last_lines(str(log_file), 5) == (["line 1", "line 2"], 14)
+
+    def test_spans_blocks(self, tmp_path: Path):
+        """Test that lines crossing block boundaries are reassembled."""
+        log_file = tmp_path / "test.log"
+        lines = [f"log line {i}" for i in range(100)]
+        log_file.write_text("\n".join(lines) + "\n")
+
+        result, offset = read_last_lines(str(log_file), 10, block_size=16)
+        assert result == lines[-10:]
+        assert offset == log_file.stat().st_size
+
+    def test_empty_file(self, tmp_path: Path):
+        """Test that an empty file returns no lines at offset 0."""
+        log_file = tmp_path / "empty.log"
+        log_file.write_text("")
+
+        assert read_last_lines(str(log_file), 10) == ([], 0)
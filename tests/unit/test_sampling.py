@@ -0,0 +1,85 @@
+"""Unit tests for logtap.core.sampling module."""
+
+import random
+
+import pytest
+
+from logtap.core.sampling import StreamSampler, build_sampler, parse_sample_rate
+
+
+class FakeClock:
+    """Manually advanced clock for rate limiting tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestParseSampleRate:
+    """Tests for parse_sample_rate()."""
+
+    def test_fraction(self):
+        assert parse_sample_rate("1/10") == 10
+
+    def test_plain_number(self):
+        assert parse_sample_rate("5") == 5
+
+    @pytest.mark.parametrize("value", ["2/10", "1/0", "abc", ""])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_sample_rate(value)
+
+
+class TestStreamSampler:
+    """Tests for StreamSampler."""
+
+    def test_every_nth_across_batches(self):
+        """Test that 1-in-N sampling continues across batch boundaries."""
+        sampler = StreamSampler(every=3)
+        assert sampler.apply([0, 1, 2, 3]) == [0, 3]
+        assert sampler.apply([4, 5, 6, 7]) == [6]
+        assert sampler.take_suppressed() == 5
+        assert sampler.take_suppressed() == 0
+
+    def test_reservoir_keeps_order(self):
+        """Test that the reservoir keeps a fixed number of items in order."""
+        sampler = StreamSampler(reservoir=5, rng=random.Random(42))
+        kept = sampler.apply(list(range(100)))
+        assert len(kept) == 5
+        assert kept == sorted(kept)
+        assert sampler.take_suppressed() == 95
+
+    def test_rate_limit_refills(self):
+        """Test that the rate limit allows a burst, then refills over time."""
+        clock = FakeClock()
+        sampler = StreamSampler(max_per_sec=10, clock=clock)
+        assert len(sampler.apply(list(range(50)))) == 10
+        assert sampler.apply(list(range(50))) == []
+
+        clock.now += 0.5
+        assert len(sampler.apply(list(range(50)))) == 5
+        assert sampler.take_suppressed() == 135
+
+    def test_suppressed_only_frames_are_throttled(self):
+        """Test that frames with nothing kept go out at most once per interval."""
+        clock = FakeClock()
+        sampler = StreamSampler(max_per_sec=1, flush_interval=1.0, clock=clock)
+        sampler.apply([1])
+        sampler.take_suppressed()
+
+        assert not sampler.should_send(sampler.apply([2, 3]))
+        clock.now += 0.5
+        assert not sampler.should_send(sampler.apply([]))
+        clock.now += 0.6
+        kept = sampler.apply([4])
+        assert sampler.should_send(kept)
+
+    def test_build_sampler_inactive(self):
+        assert build_sampler() is None
+        assert build_sampler(sample="1/1") is None
+
+    def test_build_sampler_invalid(self):
+        with pytest.raises(ValueError):
+            build_sampler(max_lines_per_sec=0)
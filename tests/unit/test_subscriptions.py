@@ -0,0 +1,66 @@
+"""Unit tests for logtap.core.subscriptions module."""
+
+from pathlib import Path
+
+import pytest
+
+from logtap.core.subscriptions import Subscription
+
+
+class TestSubscription:
+    """Tests for Subscription."""
+
+    def test_subscribe_starts_at_end(self, tmp_path: Path):
+        """Test that existing files are followed from their end."""
+        (tmp_path / "app.log").write_text("old\n")
+        subscription = Subscription(str(tmp_path))
+
+        assert subscription.subscribe(["*.log"]) == ["app.log"]
+        assert subscription.files["app.log"].offset == 4
+
+    async def test_read_batch_across_files(self, tmp_path: Path):
+        """Test that one batch collects lines from every file."""
+        (tmp_path / "a.log").write_text("")
+        (tmp_path / "b.log").write_text("")
+        subscription = Subscription(str(tmp_path))
+        subscription.subscribe(["a.log", "b.log"])
+
+        (tmp_path / "a.log").write_text("a1\na2\n")
+        (tmp_path / "b.log").write_text("b1\npartial")
+
+        batch = await subscription.read_batch(max_lines=100)
+        assert sorted(batch) == [("a.log", "a1"), ("a.log", "a2"), ("b.log", "b1")]
+        assert await subscription.read_batch(max_lines=100) == []
+
+    async def test_read_batch_respects_max_lines(self, tmp_path: Path):
+        """Test that unread lines are kept for the next batch."""
+        (tmp_path / "a.log").write_text("")
+        subscription = Subscription(str(tmp_path))
+        subscription.subscribe(["a.log"])
+        (tmp_path / "a.log").write_text("1\n2\n3\n")
+
+        assert await subscription.read_batch(max_lines=2) == [("a.log", "1"), ("a.log", "2")]
+        assert await subscription.read_batch(max_lines=2) == [("a.log", "3")]
+
+    def test_rescan_adds_new_files_from_start(self, tmp_path: Path):
+        """Test that files appearing later are followed from offset 0."""
+        subscription = Subscription(str(tmp_path))
+        subscription.subscribe(["*.log"])
+        (tmp_path / "new.log").write_text("hello\n")
+
+        assert subscription.rescan() == ["new.log"]
+        assert subscription.files["new.log"].offset == 0
+
+    def test_rejects_invalid_pattern(self, tmp_path: Path):
+        """Test that traversal patterns raise ValueError."""
+        subscription = Subscription(str(tmp_path))
+        with pytest.raises(ValueError):
+            subscription.subscribe(["../*.log"])
+
+    def test_max_files(self, tmp_path: Path):
+        """Test that a pattern matching too many files is rejected."""
+        for i in range(3):
+            (tmp_path / f"{i}.log").write_text("")
+        subscription = Subscription(str(tmp_path), max_files=2)
+        with pytest.raises(ValueError):
+            subscription.subscribe(["*.log"])
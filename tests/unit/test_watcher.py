@@ -0,0 +1,54 @@
+"""Unit tests for logtap.core.watcher module."""
+
+import asyncio
+from pathlib import Path
+
+from logtap.core.watcher import get_file_state, get_watcher
+
+
+class TestFileWatcher:
+    """Tests for FileWatcher."""
+
+    async def test_returns_immediately_if_already_changed(self, tmp_path: Path):
+        """Test that a stale offset does not wait."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\n")
+
+        watcher = get_watcher(str(log_file), interval=0.01)
+        assert await watcher.wait_for_change(0, timeout=5) is True
+
+    async def test_timeout(self, tmp_path: Path):
+        """Test that an unchanged file times out."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\n")
+
+        watcher = get_watcher(str(log_file), interval=0.01)
+        assert await watcher.wait_for_change(7, timeout=0.05) is False
+        assert watcher.waiters == 0
+
+    async def test_wakes_all_waiters_on_append(self, tmp_path: Path):
+        """Test that one append wakes every parked waiter."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\n")
+
+        watcher = get_watcher(str(log_file), interval=0.01)
+        waiters = [
+            asyncio.create_task(watcher.wait_for_change(7, timeout=5)) for _ in range(50)
+        ]
+        await asyncio.sleep(0.05)
+        assert watcher.waiters == 50
+
+        with open(log_file, "a") as f:
+            f.write("line 2\n")
+
+        assert all(await asyncio.gather(*waiters))
+
+    async def test_shared_per_path(self, tmp_path: Path):
+        """Test that the same watcher is returned for the same path."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("")
+        assert get_watcher(str(log_file)) is get_watcher(str(log_file))
+
+    def test_file_state_missing(self, tmp_path: Path):
+        """Test that a missing file has no state."""
+        assert get_file_state(str(tmp_path / "missing.log")) is None